@@ -17,6 +17,7 @@ from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tupl
 from typing import cast as typecast
 
 import collections
+import copy
 import importlib
 import json
 import logging
@@ -24,6 +25,24 @@ import os
 
 import jsonschema
 
+# orjson is much faster than the stdlib at parsing JSON, but it's optional: fall back
+# to json.loads if it's not installed. Either way, parse errors are JSONDecodeErrors.
+json_loads: Any = json.loads
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    pass
+
+# fastjsonschema compiles a JSONSchema into a specialized Python function, which is
+# far faster than jsonschema's interpreter. It's optional too: without it, we just
+# use jsonschema for everything.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from multi import multi
 from pkg_resources import Requirement, resource_filename
 from google.protobuf import json_format
@@ -52,6 +71,28 @@ StringOrList = Union[str, List[str]]
 # like a lambda that's tailored to the apiVersion and kind of the resource.
 Validator = Callable[[ACResource], RichStatus]
 
+# OKStatus is the RichStatus we hand back whenever something succeeds. Callers only
+# ever check a successful status for truthiness, so there's no point in building
+# (and formatting a message for) a new one for every resource -- that only matters
+# for errors.
+OKStatus = RichStatus.OK(msg="ok")
+
+
+def is_plain_json(obj: Any) -> bool:
+    """
+    Returns True if obj is made only of dicts with string keys, lists, strings,
+    numbers, booleans, and None -- that is, if json.dumps won't have to coerce
+    anything to serialize it.
+    """
+
+    if isinstance(obj, dict):
+        return all(isinstance(k, str) and is_plain_json(v) for k, v in obj.items())
+
+    if isinstance(obj, list):
+        return all(is_plain_json(v) for v in obj)
+
+    return (obj is None) or isinstance(obj, (str, int, float))
+
 
 class Config:
     # CLASS VARIABLES
@@ -91,13 +132,45 @@ class Config:
         'kubernetesserviceresolver'
     }
 
+    # jsonschema_results remembers JSONSchema validation outcomes across Config instances:
+    # (schema dir, schema key, serialized resource) => error message, or None if valid.
+    # It holds at most jsonschema_results_limit entries, evicting the least recently
+    # used first. The limit is never less than jsonschema_results_max, and load_all
+    # raises it to twice the number of resources it saw, so that a big cluster's
+    # resources all fit.
+    jsonschema_results: ClassVar['collections.OrderedDict[Tuple[str, str, str], Optional[str]]'] = collections.OrderedDict()
+    jsonschema_results_max: ClassVar[int] = 4096
+    jsonschema_results_limit: ClassVar[int] = jsonschema_results_max
+
+    # fast_validators holds fastjsonschema-compiled validators, shared across Config
+    # instances: (schema dir, schema key) => validator, or None if it wouldn't compile.
+    fast_validators: ClassVar[Dict[Tuple[str, str], Optional[Callable[[dict], Any]]]] = {}
+
+    # loaded_schemas holds what load_schemas found, shared across Config instances:
+    # schema dir => (schemas, schema_validators).
+    loaded_schemas: ClassVar[Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+
     # INSTANCE VARIABLES
     ambassador_nodename: str = "ambassador"     # overridden in Config.reset
 
     current_resource: Optional[ACResource] = None
     helm_chart: Optional[str]
 
-    validators: Dict[str, Validator]
+    schema_dir_path: str
+
+    # schema key ("v2-Mapping" etc.) => JSONSchema, and compiled validator
+    schemas: Dict[str, Any]
+    schema_validators: Dict[str, Any]
+
+    # lowercased kind => handler for resources of that kind (including stashing
+    # the kinds in StorageByKind)
+    handlers: Dict[str, Callable[[ACResource], None]]
+
+    # apiVersion => parsed apiVersion (see parse_api_version)
+    api_versions: Dict[str, Optional[Tuple[str, str, Optional[str]]]]
+
+    # (apiVersion, kind) => Validator
+    validators: Dict[Tuple[str, str], Validator]
     config: Dict[str, Dict[str, ACResource]]
 
     breakers: Dict[str, ACResource]
@@ -124,7 +197,7 @@ class Config:
         if not schema_dir_path:
             # Note that this "resource_filename" has to do with setuptool packages, not
             # with our ACResource class.
-            schema_dir_path = resource_filename(Requirement.parse("ambassador"), "schemas")
+            schema_dir_path = typecast(str, resource_filename(Requirement.parse("ambassador"), "schemas"))
 
         self.statsd: Dict[str, Any] = {
             'enabled': (os.environ.get('STATSD_ENABLED', '').lower() == 'true'),
@@ -145,11 +218,29 @@ class Config:
 
         self.schema_dir_path = schema_dir_path
 
-        self.logger.debug("SCHEMA DIR    %s" % os.path.abspath(self.schema_dir_path))
+        self.logger.debug("SCHEMA DIR    %s", os.path.abspath(self.schema_dir_path))
         self.k8s_status_updates: Dict[str, Tuple[str, str, Optional[Dict[str, Any]]]] = {}  # Tuple is (name, namespace, status_json)
         self.k8s_ingresses: Dict[str, Any] = {}
         self.k8s_ingress_classes: Dict[str, Any] = {}
         self.pod_labels: Dict[str, str] = {}
+
+        # Find all our handle_* methods once, rather than looking up the handler
+        # by name for every resource we process. The handler for kind "Foo" is
+        # handle_foo.
+        self.handlers = {
+            name[len('handle_'):]: getattr(self, name)
+            for name in dir(self) if name.startswith('handle_')
+        }
+
+        # Kinds in StorageByKind just get stashed directly, and they take precedence
+        # over any handle_* method, so that process() needs only one lookup no matter
+        # what kind of resource it's dealing with.
+        for lkind, store_as in Config.StorageByKind.items():
+            # Ew. Early binding for Python lambdas is kinda weird.
+            self.handlers[lkind] = typecast(Callable[[ACResource], None],
+                                            lambda resource, store_as=store_as: self.safe_store(store_as, resource))
+
+        self.load_schemas()
         self._reset()
 
     def _reset(self) -> None:
@@ -162,6 +253,7 @@ class Config:
         self.current_resource = None
         self.helm_chart = None
 
+        self.api_versions = {}
         self.validators = {}
         self.config = {}
 
@@ -195,7 +287,7 @@ class Config:
         for kind, configs in self.config.items():
             s.append("  %s:" % kind)
 
-            for rkey, resource in configs.items():
+            for resource in configs.values():
                 s.append("    %s" % resource)
 
         s.append(">")
@@ -235,8 +327,6 @@ class Config:
     # Often good_ambassador_id will be passed an ACResource, but sometimes
     # just a plain old dict.
     def good_ambassador_id(self, resource: dict):
-        resource_kind = resource.get('kind', '')
-
         # Is an ambassador_id present in this object?
         #
         # NOTE WELL: when we update the status of a Host (or a Mapping?) then reserialization
@@ -247,12 +337,17 @@ class Config:
         if allowed_ids is None:
             allowed_ids = resource.get('ambassador_id', 'default')
 
+        # Fast path: by far the most common case is a single ID that's exactly ours
+        # (usually 'default' on both sides).
+        if allowed_ids and (allowed_ids == Config.ambassador_id):
+            return True
+
         # If we find the array [ '_automatic_' ] then allow it, so that hardcoded resources
         # can have a useful effect. This is mostly for init-config, but could be used for
         # other things, too.
 
         if allowed_ids == [ "_automatic_" ]:
-            self.logger.debug(f"ambassador_id {allowed_ids} always accepted")
+            self.logger.debug("ambassador_id %s always accepted", allowed_ids)
             return True
 
         if allowed_ids:
@@ -265,10 +360,12 @@ class Config:
             if Config.ambassador_id in allowed_ids:
                 return True
             else:
+                resource_kind = resource.get('kind', '')
                 rkey = resource.get('rkey', '-anonymous-yaml-')
                 name = resource.get('name', '-no-name-')
 
-                self.logger.debug(f"{rkey}: {resource_kind} {name} has IDs {allowed_ids}, no match with {Config.ambassador_id}")
+                self.logger.debug("%s: %s %s has IDs %s, no match with %s",
+                                  rkey, resource_kind, name, allowed_ids, Config.ambassador_id)
                 return False
 
     def incr_count(self, key: str) -> None:
@@ -281,7 +378,12 @@ class Config:
         """
         Save a given ACResource as a source of Ambassador config information.
         """
-        self.sources[resource.rkey] = resource
+        rkey = resource.rkey
+
+        # Both process() and post_error() save sources, so we often see the same
+        # resource more than once. Don't bother rewriting it if so.
+        if self.sources.get(rkey) is not resource:
+            self.sources[rkey] = resource
 
     def load_all(self, resources: Iterable[ACResource]) -> None:
         """
@@ -293,23 +395,33 @@ class Config:
 
         rcount = 0
 
+        # This loop runs once per resource, so look up the methods it needs just
+        # once, up front.
+        good_ambassador_id = self.good_ambassador_id
+        process = self.process
+        post_error = self.post_error
+
         for resource in resources:
-            self.logger.debug(f"Trying to parse resource: {resource}")
+            self.logger.debug("Trying to parse resource: %s", resource)
 
             rcount += 1
 
-            if not self.good_ambassador_id(resource):
+            if not good_ambassador_id(resource):
                 continue
 
-            self.logger.debug("LOAD_ALL: %s @ %s" % (resource, resource.location))
+            self.logger.debug("LOAD_ALL: %s @ %s", resource, resource.location)
 
-            rc = self.process(resource)
+            rc = process(resource)
 
             if not rc:
                 # Object error. Not good but we'll allow the system to start.
-                self.post_error(rc, resource=resource)
+                post_error(rc, resource=resource)
+
+        self.logger.debug("LOAD_ALL: processed %d resource%s", rcount, "" if (rcount == 1) else "s")
 
-        self.logger.debug("LOAD_ALL: processed %d resource%s" % (rcount, "" if (rcount == 1) else "s"))
+        # Make sure there's room to remember validation outcomes for all of these
+        # resources next time, plus the ones that change in the meantime.
+        Config.jsonschema_results_limit = max(Config.jsonschema_results_max, 2 * rcount)
 
         if self.fatal_errors:
             # Kaboom.
@@ -327,10 +439,14 @@ class Config:
         if resource is not None:
             rkey = resource.rkey
 
-        notices = self.notices.setdefault(rkey, [])
+        notices = self.notices.get(rkey)
+
+        if notices is None:
+            notices = self.notices[rkey] = []
+
         notices.append(msg)
 
-        self.logger.log(log_level, "%s: NOTICE: %s" % (rkey, msg))
+        self.logger.log(log_level, "%s: NOTICE: %s", rkey, msg)
 
     @multi
     def post_error(self, msg: Union[RichStatus, str], resource: Optional[Resource]=None, rkey: Optional[str]=None, log_level=logging.INFO) -> str:
@@ -355,19 +471,26 @@ class Config:
         if resource is None:
             resource = self.current_resource
 
-        if not rkey:
-            rkey = '-global-'
+        # rkey is Optional, so work out a str key of our own to file this error under.
+        if rkey:
+            error_rkey = rkey
+        else:
+            error_rkey = '-global-'
 
             if resource is not None:
-                rkey = resource.rkey
+                error_rkey = resource.rkey
 
                 if isinstance(resource, ACResource):
                     self.save_source(resource)
 
-        errors = self.errors.setdefault(rkey, [])
+        errors = self.errors.get(error_rkey)
+
+        if errors is None:
+            errors = self.errors[error_rkey] = []
+
         errors.append(rc.as_dict())
 
-        self.logger.log(log_level, "%s: %s" % (rkey, rc))
+        self.logger.log(log_level, "%s: %s", error_rkey, rc)
 
     def process(self, resource: ACResource) -> RichStatus:
         # This should be impossible.
@@ -400,80 +523,51 @@ class Config:
             # Well that's no good.
             return rc
 
-        # OK, so far so good. Should we just stash this somewhere?
-        lkind = resource.kind.lower()
-        store_as = Config.StorageByKind.get(lkind)
-
-        if store_as:
-            # Just stash it.
-            self.safe_store(store_as, resource)
-        else:
-            # Can't just stash it. Is there a handler for this kind of resource?
-            handler_name = f"handle_{lkind}"
-            handler = getattr(self, handler_name, None)
+        # OK, so far so good. Is there a handler for this kind of resource? (This includes
+        # just stashing things that live in StorageByKind.)
+        handler = self.handlers.get(resource.kind.lower(), None)
 
-            if not handler:
-                self.logger.warning("%s: no handler for %s, just saving" % (resource, resource.kind))
-                handler = self.save_object
-            # else:
-            #     self.logger.debug("%s: handling %s..." % (resource, resource.kind))
+        if not handler:
+            self.logger.warning("%s: no handler for %s, just saving", resource, resource.kind)
+            handler = self.save_object
+        # else:
+        #     self.logger.debug("%s: handling %s..." % (resource, resource.kind))
 
-            try:
-                handler(resource)
-            except Exception as e:
-                # Bzzzt.
-                raise
-                # return RichStatus.fromError("%s: could not process %s object: %s" % (resource, resource.kind, e))
+        try:
+            handler(resource)
+        except Exception as e:
+            # Bzzzt.
+            raise
+            # return RichStatus.fromError("%s: could not process %s object: %s" % (resource, resource.kind, e))
 
         # OK, all's well.
         self.current_resource = None
 
-        return RichStatus.OK(msg="%s object processed successfully" % resource.kind)
+        return OKStatus
 
     def validate_object(self, resource: ACResource) -> RichStatus:
         # This is basically "impossible"
         if not (("apiVersion" in resource) and ("kind" in resource) and ("name" in resource)):
             return RichStatus.fromError("must have apiVersion, kind, and name")
 
-        apiVersion = resource.apiVersion
-        originalApiVersion = apiVersion
+        originalApiVersion = resource.apiVersion
+        parsed = self.parse_api_version(originalApiVersion)
 
-        # The Canonical API Version for our resources always starts with "getambassador.io/",
-        # but it used to always start with "ambassador/". Translate as needed for backward
-        # compatibility.
+        if parsed is None:
+            return RichStatus.fromError("apiVersion %s unsupported" % originalApiVersion)
 
-        if apiVersion.startswith('ambassador/'):
-            apiVersion = apiVersion.replace('ambassador/', 'getambassador.io/')
-            resource.apiVersion = apiVersion
+        canonicalApiVersion, apiVersion, version_status = parsed
 
-        is_ambassador = False
+        if canonicalApiVersion != originalApiVersion:
+            resource.apiVersion = canonicalApiVersion
 
-        # OK. If it really starts with getambassador.io/, we're good, and we can strip
-        # that off to make comparisons and keying easier.
-        if apiVersion.startswith("getambassador.io/"):
-            is_ambassador = True
-            apiVersion = apiVersion.split('/')[1]
-        elif apiVersion.startswith('networking.internal.knative.dev'):
-            # This is not an Ambassador resource, we're trying to parse Knative
-            # here
-            pass
-        else:
-            return RichStatus.fromError("apiVersion %s unsupported" % apiVersion)
-
-        ns = resource.get('namespace') or self.ambassador_namespace
-        name = f"{resource.name} ns {ns}"
-
-        version = apiVersion.lower()
-
-        # Is this deprecated?
-        if is_ambassador:
-            status = Config.SupportedVersions.get(version, 'is not supported')
-
-            if status != 'ok':
-                self.post_notice(f"apiVersion {originalApiVersion} {status}", resource=resource)
+        # Is this deprecated? (version_status is None for non-Ambassador resources.)
+        if version_status and (version_status != 'ok'):
+            self.post_notice(f"apiVersion {originalApiVersion} {version_status}", resource=resource)
 
         if resource.kind.lower() in Config.NoSchema:
-            return RichStatus.OK(msg=f"no schema for {resource.kind} {name} so calling it good")
+            # No schema, so call it good.
+            return OKStatus
 
         # OK, now we need to decide what more we need to do. Start by assuming that we will,
         # in fact, need to do full schema validation for this object.
@@ -514,7 +608,7 @@ class Config:
                 need_validation = True
 
         # OK, assume that we won't be validating so we can just report that...
-        rc = RichStatus.OK(msg=f"validation not needed for {apiVersion} {resource.kind} {name} so calling it good")
+        rc = OKStatus
 
         # ...then, let's see whether reality matches our assumption.
         if need_validation:
@@ -528,16 +622,25 @@ class Config:
                 rc = validator(resource)
             else:
                 # No validator, so, uh, call it good.
-                rc = RichStatus.OK(msg=f"no validator for {apiVersion} {resource.kind} {name} so calling it good")
+                rc = OKStatus
 
             if watt_errors:
                 # watt reported errors. Did we find errors or not?
 
                 if rc:
                     # We did not. Post this into fast_validation_disagreements
-                    fvd = self.fast_validation_disagreements.setdefault(resource.rkey, [])
+                    fvd = self.fast_validation_disagreements.get(resource.rkey)
+
+                    if fvd is None:
+                        fvd = self.fast_validation_disagreements[resource.rkey] = []
+
                     fvd.append(watt_errors)
-                    self.logger.debug(f"validation disagreement: good {resource.kind} {name} has watt errors {watt_errors}")
+
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        ns = resource.get('namespace') or self.ambassador_namespace
+                        name = f"{resource.name} ns {ns}"
+                        self.logger.debug("validation disagreement: good %s %s has watt errors %s",
+                                          resource.kind, name, watt_errors)
 
                     # Note that we override watt here by returning the successful
                     # result from our validator. That's intentional in 1.6.0.
@@ -547,16 +650,63 @@ class Config:
                     rc = RichStatus.fromError(watt_errors)
             
         # One way or the other, we're done here. Finally.
-        self.logger.debug(f"validation {rc}")
+        self.logger.debug("validation %s", rc)
         return rc
 
+    def parse_api_version(self, apiVersion: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Parses an apiVersion into a tuple of (canonical apiVersion, short version,
+        support status). The support status comes from Config.SupportedVersions, and
+        is None for resources that aren't Ambassador resources. Returns None if the
+        apiVersion isn't supported at all.
+
+        There are only ever a handful of distinct apiVersions, so the results are
+        cached and the string munging happens once per apiVersion, not once per
+        resource.
+
+        :param apiVersion: the apiVersion from the resource
+        """
+
+        if apiVersion in self.api_versions:
+            return self.api_versions[apiVersion]
+
+        canonical = apiVersion
+        parsed: Optional[Tuple[str, str, Optional[str]]] = None
+
+        # The Canonical API Version for our resources always starts with "getambassador.io/",
+        # but it used to always start with "ambassador/". Translate as needed for backward
+        # compatibility.
+
+        if canonical.startswith('ambassador/'):
+            canonical = canonical.replace('ambassador/', 'getambassador.io/')
+
+        # OK. If it really starts with getambassador.io/, we're good, and we can strip
+        # that off to make comparisons and keying easier.
+        if canonical.startswith("getambassador.io/"):
+            version = canonical.split('/')[1]
+            status = Config.SupportedVersions.get(version.lower(), 'is not supported')
+
+            parsed = (canonical, version, status)
+        elif canonical.startswith('networking.internal.knative.dev'):
+            # This is not an Ambassador resource, we're trying to parse Knative
+            # here
+            parsed = (canonical, canonical, None)
+
+        self.api_versions[apiVersion] = parsed
+
+        return parsed
+
     def get_validator(self, apiVersion: str, kind: str) -> Validator:
-        schema_key = "%s-%s" % (apiVersion, kind)
+        schema_key = (apiVersion, kind)
 
         validator = self.validators.get(schema_key, None)
 
-        if not validator:
-            validator = self.get_proto_validator(apiVersion, kind)
+        if validator:
+            # We've already worked out how to validate this kind of thing, which is the
+            # case for every resource but the first of each (apiVersion, kind).
+            return validator
+
+        validator = self.get_proto_validator(apiVersion, kind)
 
         if not validator:
             validator = self.get_jsonschema_validator(apiVersion, kind)
@@ -572,9 +722,9 @@ class Config:
         return validator
 
     def cannot_validate(self, apiVersion: str, kind: str) -> RichStatus:
-        self.logger.debug(f"Cannot validate getambassador.io/{apiVersion} {kind}")
+        self.logger.debug("Cannot validate getambassador.io/%s %s", apiVersion, kind)
 
-        return RichStatus.OK(msg="Not validating getambassador.io/{apiVersion} {kind}")
+        return OKStatus
 
     def get_proto_validator(self, apiVersion, kind) -> Optional[Validator]:
         # See if we can import a protoclass...
@@ -626,42 +776,186 @@ class Config:
         except json_format.ParseError as e:
             return RichStatus.fromError(str(e))
 
-        return RichStatus.OK(msg=f"good {resource.kind}")
+        return OKStatus
 
-    def get_jsonschema_validator(self, apiVersion, kind) -> Optional[Validator]:
-        # Do we have a JSONSchema on disk for this?
-        schema_path = os.path.join(self.schema_dir_path, apiVersion, f"{kind}.schema")
+    def load_schemas(self) -> None:
+        """
+        Loads and compiles every JSONSchema under our schema_dir_path, so that we never
+        have to go to disk while validating resources. The schema for a given kind lives
+        in schema_dir_path/<apiVersion>/<kind>.schema.
+
+        The schemas only change when Ambassador does, so each schema_dir_path is
+        loaded only once, and every Config using it shares the results.
+        """
+
+        loaded = Config.loaded_schemas.get(self.schema_dir_path, None)
+
+        if loaded is not None:
+            self.schemas, self.schema_validators = loaded
+            return
+
+        self.schemas = {}
+        self.schema_validators = {}
 
         try:
-            schema = json.load(open(schema_path, "r"))
+            version_dirs = [ entry for entry in os.scandir(self.schema_dir_path) if entry.is_dir() ]
+        except OSError as e:
+            self.logger.debug(f"no schemas at {self.schema_dir_path}, not validating ({e})")
+            return
 
-            # Note that we'll never get here if the schema doesn't parse.
-            if schema:
-                self.logger.debug(f"using validate_with_jsonschema for getambassador.io/{apiVersion} {kind}")
+        for version_dir in version_dirs:
+            try:
+                entries = list(os.scandir(version_dir.path))
+            except OSError as e:
+                self.logger.warning(f"unreadable schema directory {version_dir.path}, skipping ({e})")
+                continue
+
+            for entry in entries:
+                if not (entry.name.endswith('.schema') and entry.is_file()):
+                    continue
+
+                kind = entry.name[:-len('.schema')]
+                schema_key = "%s-%s" % (version_dir.name, kind)
+
+                try:
+                    with open(entry.path, "rb") as schema_file:
+                        schema = json_loads(schema_file.read())
+
+                    # Note that we'll never get here if the schema doesn't parse.
+                    if not schema:
+                        continue
+
+                    # jsonschema.validate() would pick the validator class, check the schema,
+                    # and build a new validator on _every_ call. Do all of that once here, and
+                    # just hang onto the validator instance.
+                    validator_class = jsonschema.validators.validator_for(schema)
+                    validator_class.check_schema(schema)
+
+                    self.schemas[schema_key] = schema
+                    self.schema_validators[schema_key] = validator_class(schema)
+                except OSError as e:
+                    self.logger.warning(f"unreadable schema at {entry.path}, skipping ({e})")
+                except json.decoder.JSONDecodeError as e:
+                    self.logger.warning(f"corrupt schema at {entry.path}, skipping ({e})")
+                except jsonschema.exceptions.SchemaError as e:
+                    self.logger.warning(f"invalid schema at {entry.path}, skipping ({e})")
 
-                # Ew. Early binding for Python lambdas is kinda weird.
-                return typecast(Validator,
-                                lambda resource, schema=schema: self.validate_with_jsonschema(resource, schema))
-        except OSError:
-            self.logger.debug(f"no schema at {schema_path}, not validating")
+        Config.loaded_schemas[self.schema_dir_path] = (self.schemas, self.schema_validators)
+
+        self.logger.debug(f"loaded {len(self.schemas)} schema{'' if (len(self.schemas) == 1) else 's'}")
+
+    def get_jsonschema_validator(self, apiVersion, kind) -> Optional[Validator]:
+        # Do we have a JSONSchema for this?
+        schema_key = "%s-%s" % (apiVersion, kind)
+        jsv = self.schema_validators.get(schema_key, None)
+
+        if jsv is None:
+            self.logger.debug(f"no schema for getambassador.io/{apiVersion} {kind}, not validating")
             return None
-        except json.decoder.JSONDecodeError as e:
-            self.logger.warning(f"corrupt schema at {schema_path}, skipping ({e})")
+
+        fast_validator = self.get_fast_validator(schema_key)
+
+        self.logger.debug(f"using validate_with_jsonschema for getambassador.io/{apiVersion} {kind}")
+
+        # Ew. Early binding for Python lambdas is kinda weird.
+        return typecast(Validator,
+                        lambda resource, jsv=jsv, schema_key=schema_key, fast_validator=fast_validator:
+                            self.validate_with_jsonschema(resource, jsv, schema_key, fast_validator))
+
+    def get_fast_validator(self, schema_key: str) -> Optional[Callable[[dict], Any]]:
+        """
+        Returns the fastjsonschema-compiled validator for a given schema key, or None if
+        fastjsonschema isn't available or can't handle the schema.
+
+        Compiling is much more expensive than building a jsonschema validator, so it
+        happens only the first time a given schema is actually used, and the result is
+        shared by every Config in this process.
+
+        :param schema_key: schema key ("v2-Mapping" etc.) from load_schemas
+        """
+
+        if not fastjsonschema:
             return None
 
-        # This can't actually happen -- the only way to get here is to have an uncaught
-        # exception. But it shuts up mypy so WTF.
-        return None
+        fast_key = (self.schema_dir_path, schema_key)
+
+        if fast_key not in Config.fast_validators:
+            fast_validator = None
+
+            # Compile a copy, since fastjsonschema rewrites the $refs in the schema it's
+            # handed. Since resources that pass fastjsonschema never see jsonschema, the
+            # copy also gets an explicit $schema for the draft that jsonschema is using,
+            # so that the two can't quietly disagree about what passes.
+            schema = copy.deepcopy(self.schemas[schema_key])
+            schema['$schema'] = self.schema_validators[schema_key].META_SCHEMA['$schema']
+
+            try:
+                # use_default=False is critical: otherwise, the compiled validator will
+                # fill in defaults by modifying the resource it's validating.
+                fast_validator = fastjsonschema.compile(schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                self.logger.debug(f"cannot compile schema {schema_key}, using jsonschema only ({e})")
+
+            Config.fast_validators[fast_key] = fast_validator
+
+        return Config.fast_validators[fast_key]
+
+    def validate_with_jsonschema(self, resource: ACResource, jsv: Any, schema_key: str,
+                                 fast_validator: Optional[Callable[[dict], Any]]=None) -> RichStatus:
+        rdict = resource.as_dict()
+
+        if fast_validator:
+            try:
+                fast_validator(rdict)
+
+                # All good. Return an OK.
+                return OKStatus
+            except fastjsonschema.JsonSchemaException:
+                # Nope. Fall through to jsonschema, both because its error messages are
+                # what we've always reported, and because on failure, jsonschema gets the
+                # last word.
+                pass
+
+        # Validation depends only on the schema and on the contents of the resource, and
+        # most resources come through unchanged on every reconfiguration, so remember the
+        # outcome for each (schema, serialized resource) that we've seen.
+        result_key: Optional[Tuple[str, str, str]] = None
 
-    def validate_with_jsonschema(self, resource: ACResource, schema: dict) -> RichStatus:
         try:
-            jsonschema.validate(resource.as_dict(), schema)
-        except jsonschema.exceptions.ValidationError as e:
+            serialized = json.dumps(rdict, sort_keys=True, separators=(',', ':'))
+
+            # json.dumps quietly turns non-string keys into strings (and tuples into
+            # lists), so different resources could serialize identically. Only cache
+            # resources that round-trip exactly.
+            if is_plain_json(rdict):
+                result_key = (self.schema_dir_path, schema_key, serialized)
+        except (TypeError, ValueError):
+            # Not serializable as JSON at all, so don't try to cache it.
+            pass
+
+        if (result_key is not None) and (result_key in Config.jsonschema_results):
+            error = Config.jsonschema_results[result_key]
+            Config.jsonschema_results.move_to_end(result_key)
+        else:
+            # We only ever report one error. Pick it with best_match, exactly as
+            # jsonschema.validate() does, so that users see the same error they always
+            # have -- and skip paying for a raise and catch. (Note that jsv.validate()
+            # would raise the _first_ error, which is often a less useful one.)
+            e = jsonschema.exceptions.best_match(jsv.iter_errors(rdict))
+            error = f"not a valid {resource.kind}: {e}" if (e is not None) else None
+
+            if result_key is not None:
+                Config.jsonschema_results[result_key] = error
+
+                while len(Config.jsonschema_results) > Config.jsonschema_results_limit:
+                    Config.jsonschema_results.popitem(last=False)
+
+        if error:
             # Nope. Bzzzzt.
-            return RichStatus.fromError(f"not a valid {resource.kind}: {e}")
+            return RichStatus.fromError(error)
 
         # All good. Return an OK.
-        return RichStatus.OK(msg=f"good {resource.kind}")
+        return OKStatus
 
     def safe_store(self, storage_name: str, resource: ACResource, allow_log: bool=True) -> None:
         """
@@ -674,27 +968,29 @@ class Config:
         :param allow_log: if True, logs that we're saving this thing.
         """
 
-        storage = self.config.setdefault(storage_name, {})
+        storage = self.get_storage(storage_name)
+        name = resource.name
+        existing = storage.get(name, None)
 
-        if resource.name in storage:
-            if resource.namespace == storage[resource.name].get('namespace'):
+        if existing is not None:
+            if resource.namespace == existing.get('namespace'):
                 # If the name and namespace, both match, then it's definitely an error.
                 # Oooops.
                 self.post_error("%s defines %s %s, which is already defined by %s" %
-                                (resource, resource.kind, resource.name, storage[resource.name].location),
+                                (resource, resource.kind, name, existing.location),
                                 resource=resource)
             else:
                 # Here, we deal with the case when multiple resources have the same name but they exist in different
                 # namespaces. Our current data structure to store resources is a flat string. Till we move to
                 # identifying resources with both, name and namespace, we change names of any subsequent resources with
                 # the same name here.
-                resource.name = f'{resource.name}.{resource.namespace}'
+                name = f'{name}.{resource.namespace}'
+                resource.name = name
 
         if allow_log:
-            self.logger.debug("%s: saving %s %s" %
-                              (resource, resource.kind, resource.name))
+            self.logger.debug("%s: saving %s %s", resource, resource.kind, name)
 
-        storage[resource.name] = resource
+        storage[name] = resource
 
     def save_object(self, resource: ACResource, allow_log: bool=False) -> None:
         """
@@ -707,6 +1003,22 @@ class Config:
 
         self.safe_store(resource.kind, resource, allow_log=allow_log)
 
+    def get_storage(self, storage_name: str) -> Dict[str, ACResource]:
+        """
+        Fetch the storage bucket for a given storage name, creating it if it doesn't
+        exist yet. (This is what setdefault would do, without building a new empty
+        dict on every call.)
+
+        :param storage_name: name of the bucket you want.
+        """
+
+        storage = self.config.get(storage_name, None)
+
+        if storage is None:
+            storage = self.config[storage_name] = {}
+
+        return storage
+
     def get_config(self, key: str) -> Optional[Dict[str, ACResource]]:
         return self.config.get(key, None)
 
@@ -762,9 +1074,10 @@ class Config:
         the rkey, not the name.
         """
 
-        self.logger.debug(f"Handling secret resource {resource.as_dict()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Handling secret resource %s", resource.as_dict())
 
-        storage = self.config.setdefault('secrets', {})
+        storage = self.get_storage('secrets')
         key = resource.rkey
 
         if key in storage:
@@ -775,7 +1088,7 @@ class Config:
         storage[key] = resource
 
     def handle_ingress(self, resource: ACResource) -> None:
-        storage = self.config.setdefault('ingresses', {})
+        storage = self.get_storage('ingresses')
         key = resource.rkey
 
         if key in storage:
@@ -791,7 +1104,7 @@ class Config:
         the rkey, not the name, and because we need to check the helm_chart attribute.
         """
 
-        storage = self.config.setdefault('service', {})
+        storage = self.get_storage('service')
         key = resource.rkey
 
         if key in storage:
@@ -799,8 +1112,7 @@ class Config:
                             (resource, resource.kind, key, storage[key].location),
                             resource=resource)
 
-        self.logger.debug("%s: saving %s %s" %
-                          (resource, resource.kind, key))
+        self.logger.debug("%s: saving %s %s", resource, resource.kind, key)
 
         storage[key] = resource
 
@@ -0,0 +1,45 @@
+import logging
+import sys
+
+import pytest
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s test %(levelname)s: %(message)s",
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+logger = logging.getLogger("ambassador")
+
+from ambassador import Config
+from ambassador.config import ACResource
+
+
+def mapping(name: str, **kwargs) -> ACResource:
+    return ACResource(f"{name}.1", f"test {name}", kind="Mapping", name=name,
+                      apiVersion="getambassador.io/v2", prefix=f"/{name}/", service=name,
+                      **kwargs)
+
+
+def test_ambassador_id():
+    aconf = Config()
+
+    # The fetcher normally filters on ambassador_id too, so build the resources by
+    # hand to make sure that load_all has to do the filtering itself. A resource for
+    # some other Ambassador must be skipped without losing anything after it.
+    aconf.load_all([
+        mapping("before_mapping"),
+        mapping("other_mapping", ambassador_id=[ "some-other-ambassador" ]),
+        mapping("after_mapping"),
+        mapping("string_mapping", ambassador_id="some-other-ambassador"),
+        mapping("list_mapping", ambassador_id=[ "some-other-ambassador", "default" ]),
+        mapping("automatic_mapping", ambassador_id=[ "_automatic_" ]),
+    ])
+
+    mappings = aconf.config["mappings"]
+
+    assert sorted(mappings.keys()) == [ "after_mapping", "automatic_mapping", "before_mapping", "list_mapping" ]
+
+
+if __name__ == '__main__':
+    pytest.main(sys.argv)
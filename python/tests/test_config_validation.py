@@ -0,0 +1,226 @@
+from typing import Any
+
+import collections
+import logging
+import os
+import sys
+
+import pytest
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s test %(levelname)s: %(message)s",
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+logger = logging.getLogger("ambassador")
+
+import jsonschema
+
+from ambassador import Config
+from ambassador.config import ACResource
+from ambassador.fetch import ResourceFetcher
+
+yaml = '''
+---
+apiVersion: getambassador.io/v1
+kind: Mapping
+name: good_mapping
+prefix: /good/
+service: good
+---
+apiVersion: getambassador.io/v1
+kind: Mapping
+name: bad_mapping
+prefix: 3
+service: bad
+---
+apiVersion: ambassador/v1
+kind: Mapping
+name: old_mapping
+prefix: /old/
+service: old
+'''
+
+
+schema_dir_path = os.path.join(os.path.dirname(__file__), "..", "schemas")
+
+
+def load_config() -> Config:
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    fetcher = ResourceFetcher(logger, aconf)
+    fetcher.parse_yaml(yaml)
+
+    aconf.load_all(fetcher.sorted())
+
+    return aconf
+
+
+def test_config_validation():
+    # Load twice, so that the second time around we get validation results
+    # remembered from the first.
+    for i in range(2):
+        aconf = load_config()
+
+        mappings = aconf.config["mappings"]
+
+        assert "good_mapping" in mappings
+        assert "old_mapping" in mappings
+        assert "bad_mapping" not in mappings
+
+        assert mappings["old_mapping"].apiVersion == "getambassador.io/v1"
+
+        errors = [ error['error'] for rkey_errors in aconf.errors.values() for error in rkey_errors ]
+
+        assert len(errors) == 1
+        assert errors[0].startswith("not a valid Mapping: 3 is not of type 'string'")
+
+
+best_match_yaml = '''
+---
+apiVersion: getambassador.io/v2
+kind: Mapping
+name: cors_mapping
+prefix: /cors/
+service: cors
+cors:
+  origins: 3
+'''
+
+
+def test_config_validation_best_match():
+    # The first error jsonschema finds here is that origins isn't valid under
+    # any of the anyOf schemas for it, but the error we've always reported (the
+    # one jsonschema.validate() picks with best_match) is more specific. Make
+    # sure we still report that one.
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    fetcher = ResourceFetcher(logger, aconf)
+    fetcher.parse_yaml(best_match_yaml)
+
+    aconf.load_all(fetcher.sorted())
+
+    assert "cors_mapping" not in (aconf.get_config("mappings") or {})
+
+    errors = [ error['error'] for rkey_errors in aconf.errors.values() for error in rkey_errors ]
+
+    assert len(errors) == 1
+    assert errors[0].startswith("not a valid Mapping: 3 is not of type 'string'")
+
+
+def mapping(name: str, prefix: Any=None, **kwargs) -> ACResource:
+    return ACResource(f"{name}.1", f"test {name}", kind="Mapping", name=name,
+                      apiVersion="getambassador.io/v2", namespace="default",
+                      prefix=prefix or f"/{name}/", service=name,
+                      **kwargs)
+
+
+def test_config_validation_cache_keys(fresh_caches):
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    # A resource that's plain JSON gets its outcome remembered...
+    assert not aconf.validate_object(mapping("str_keys", prefix=3, add_request_headers={ "1": "x" }))
+    assert len(Config.jsonschema_results) == 1
+
+    # ...but json.dumps would turn this one's key into "1", making it look just like
+    # the one above, so it must not be remembered.
+    assert not aconf.validate_object(mapping("int_keys", prefix=3, add_request_headers={ 1: "x" }))
+    assert len(Config.jsonschema_results) == 1
+
+
+def test_config_validation_cache_limit(fresh_caches, monkeypatch):
+    # Count how many times jsonschema actually has to walk a resource.
+    walks = 0
+    best_match = jsonschema.exceptions.best_match
+
+    def counting_best_match(errors):
+        nonlocal walks
+        walks += 1
+        return best_match(errors)
+
+    monkeypatch.setattr(jsonschema.exceptions, "best_match", counting_best_match)
+    monkeypatch.setattr(Config, "jsonschema_results_max", 4)
+    monkeypatch.setattr(Config, "jsonschema_results_limit", 4)
+
+    # These are all invalid, so they go to jsonschema even with fastjsonschema.
+    resources = [ mapping(f"bad_mapping_{i}", prefix=3) for i in range(10) ]
+
+    counts = []
+
+    for i in range(3):
+        walks = 0
+        Config(schema_dir_path=schema_dir_path).load_all(resources)
+        counts.append(walks)
+
+    # The first load overflows the cache, but the most recent outcomes survive, and
+    # load_all makes room for everything after that.
+    assert counts == [ 10, 6, 0 ]
+    assert len(Config.jsonschema_results) == 10
+
+
+@pytest.fixture
+def fresh_caches(monkeypatch):
+    # Make sure nothing compiled or remembered by another test leaks in (or out).
+    monkeypatch.setattr(Config, "fast_validators", {})
+    monkeypatch.setattr(Config, "jsonschema_results", collections.OrderedDict())
+    monkeypatch.setattr(Config, "jsonschema_results_limit", Config.jsonschema_results_max)
+
+
+@pytest.mark.skipif(not fastjsonschema, reason="fastjsonschema is not installed")
+def test_fast_validation(fresh_caches):
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    assert aconf.validate_object(mapping("good_mapping"))
+
+    # fastjsonschema passed it, so jsonschema never had to look at it.
+    assert Config.fast_validators[(aconf.schema_dir_path, "v2-Mapping")] is not None
+    assert len(Config.jsonschema_results) == 0
+
+    # The fast validator is compiled for jsonschema's draft, without touching the
+    # schema that jsonschema itself uses.
+    assert aconf.schemas["v2-Mapping"]["$schema"] == "http://json-schema.org/schema#"
+
+
+@pytest.mark.skipif(not fastjsonschema, reason="fastjsonschema is not installed")
+def test_fast_validation_failure(fresh_caches):
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    # fastjsonschema fails this one, and jsonschema supplies the error message.
+    rc = aconf.validate_object(mapping("bad_mapping", prefix=3))
+
+    assert not rc
+    assert rc.as_dict()['error'].startswith("not a valid Mapping: 3 is not of type 'string'")
+
+    assert Config.fast_validators[(aconf.schema_dir_path, "v2-Mapping")] is not None
+    assert len(Config.jsonschema_results) == 1
+
+
+@pytest.mark.skipif(not fastjsonschema, reason="fastjsonschema is not installed")
+def test_fast_validation_uncompilable(fresh_caches, monkeypatch):
+    def broken_compile(*args, **kwargs):
+        raise fastjsonschema.JsonSchemaDefinitionException("nope")
+
+    monkeypatch.setattr(fastjsonschema, "compile", broken_compile)
+
+    aconf = Config(schema_dir_path=schema_dir_path)
+
+    # With no fast validator, everything goes to jsonschema.
+    assert aconf.validate_object(mapping("good_mapping"))
+
+    rc = aconf.validate_object(mapping("bad_mapping", prefix=3))
+
+    assert not rc
+    assert rc.as_dict()['error'].startswith("not a valid Mapping: 3 is not of type 'string'")
+
+    assert Config.fast_validators[(aconf.schema_dir_path, "v2-Mapping")] is None
+    assert len(Config.jsonschema_results) == 2
+
+
+if __name__ == '__main__':
+    pytest.main(sys.argv)